@@ -3,7 +3,7 @@ Provides an application factory that constructs and configures a
 Flask instance used to server the Borealis site.
 """
 
-from typing import Optional, Dict
+from typing import Any, Optional, Dict, Tuple
 import time
 
 try:
@@ -14,6 +14,58 @@ except Exception as exc:
         "Install with: pip install Flask"
     ) from exc
 
+from flask.json.provider import DefaultJSONProvider
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+class OrjsonProvider(DefaultJSONProvider):
+    """
+    JSON provider that serializes with orjson, writing response bodies
+    as bytes directly. Keys are sorted, indented in debug mode and
+    compact otherwise. Dates and dataclasses are passed through to
+    Flask's default hook (dates as HTTP dates) and non-string keys are
+    coerced, as with the stdlib provider.
+    """
+
+    def _options(self, indent: bool) -> int:
+        option = (
+            orjson.OPT_NON_STR_KEYS
+            | orjson.OPT_PASSTHROUGH_DATETIME
+            | orjson.OPT_PASSTHROUGH_DATACLASS
+        )
+        if self.sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return option
+
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        option = self._options(bool(kwargs.get("indent")))
+        return orjson.dumps(obj, default=self.default, option=option).decode(
+            "utf-8"
+        )
+
+    def loads(self, s: Any, **kwargs: Any) -> Any:
+        """
+        Parse JSON with orjson. Keyword arguments meant for json.loads
+        are not supported by orjson and are ignored.
+        """
+        return orjson.loads(s)
+
+    def response(self, *args: Any, **kwargs: Any) -> Response:
+        obj = self._prepare_response_obj(args, kwargs)
+        indent = (
+            (self.compact is None and self._app.debug)
+            or self.compact is False
+        )
+        option = self._options(indent) | orjson.OPT_APPEND_NEWLINE
+        body = orjson.dumps(obj, default=self.default, option=option)
+        return self._app.response_class(body, mimetype=self.mimetype)
+
 
 def create_app(test_config: Optional[Dict] = None) -> "Flask":
     """
@@ -24,12 +76,19 @@ def create_app(test_config: Optional[Dict] = None) -> "Flask":
         static_folder="static",
         template_folder="templates",
     )
+    if orjson is not None:
+        app.json = OrjsonProvider(app)
 
     app.config.setdefault("DEBUG", False)
     app.config.setdefault("PORT", 2929)
     app.config.setdefault("DATABASE_URL", "sqlite:///borealis.db")
     app.config.setdefault("ENCRYPTION_KEY_PATH", "secret.key")
     app.config.setdefault("DATA_DATABASE_URL", "sqlite:///borealis_data.db")
+    app.config.setdefault("TEMPLATE_CACHE_DIR", ".jinja_cache")
+    # Let browsers reuse static files for an hour; ETag/Last-Modified
+    # revalidation then answers with 304s and no body. Flask ships this
+    # key as None, so it must be assigned rather than setdefault'd.
+    app.config["SEND_FILE_MAX_AGE_DEFAULT"] = 3600
 
     if test_config:
         app.config.update(test_config)
@@ -40,6 +99,24 @@ def create_app(test_config: Optional[Dict] = None) -> "Flask":
                 app.config["ENCRYPTION_KEY_PATH"] = ":memory:"
             if "DATA_DATABASE_URL" not in test_config:
                 app.config["DATA_DATABASE_URL"] = "sqlite:///:memory:"
+            if "TEMPLATE_CACHE_DIR" not in test_config:
+                app.config["TEMPLATE_CACHE_DIR"] = None
+            if "SEND_FILE_MAX_AGE_DEFAULT" not in test_config:
+                app.config["SEND_FILE_MAX_AGE_DEFAULT"] = None
+
+    # Persist compiled template bytecode across restarts and raise the
+    # in-memory template LRU. Must be set before jinja_env is created.
+    app.jinja_options = {**app.jinja_options, "cache_size": 1000}
+    cache_dir = app.config.get("TEMPLATE_CACHE_DIR")
+    if cache_dir:
+        import os
+        from jinja2 import FileSystemBytecodeCache
+
+        os.makedirs(cache_dir, exist_ok=True)
+        app.jinja_options["bytecode_cache"] = FileSystemBytecodeCache(
+            directory=cache_dir,
+            pattern="%s.cache",
+        )
 
     from services.settings_store import SettingsService
     svc = SettingsService(
@@ -52,7 +129,7 @@ def create_app(test_config: Optional[Dict] = None) -> "Flask":
         database_url=app.config["DATA_DATABASE_URL"]
     )
 
-    from services.jellyfin import create_client
+    from services.jellyfin import create_client, split_scheme
     jf = create_client(svc)
 
     from services.sync_service import SyncService
@@ -89,6 +166,10 @@ def create_app(test_config: Optional[Dict] = None) -> "Flask":
             repo.engine.dispose()
         except Exception:
             pass
+        try:
+            jf.close()
+        except Exception:
+            pass
     
     atexit.register(cleanup)
 
@@ -101,9 +182,16 @@ def create_app(test_config: Optional[Dict] = None) -> "Flask":
             )
         return send_from_directory("assets", filename)
 
+    # Serialized GET /api/settings body, dropped whenever settings change
+    settings_cache: Dict[str, bytes] = {}
+
     @app.get("/api/settings")
     def get_settings() -> Response:
-        return jsonify(svc.get()), 200
+        body = settings_cache.get("body")
+        if body is None:
+            body = jsonify(svc.get()).get_data()
+            settings_cache["body"] = body
+        return Response(body, status=200, mimetype="application/json")
     
     @app.put("/api/settings")
     def update_settings() -> Response:
@@ -119,6 +207,8 @@ def create_app(test_config: Optional[Dict] = None) -> "Flask":
         
         # Update settings
         updated = svc.update(payload)
+        settings_cache.clear()
+        jf.refresh()
         
         # Check if server is being added for the first time
         has_server = (
@@ -150,25 +240,11 @@ def create_app(test_config: Optional[Dict] = None) -> "Flask":
         
         return jsonify(updated), 200
     
-    @app.teardown_appcontext
-    def _dispose_db(_exc: Optional[BaseException]) -> None:
-        try:
-            svc.engine.dispose()
-        except Exception:
-            pass
-        try:
-            repo.engine.dispose()
-        except Exception:
-            pass
-
     @app.get("/api/test-connection")
     def test_connection() -> Response:
         """
         Test Jellyfin connectivity using persisted settings.
         """
-        from urllib.request import Request, urlopen
-        from urllib.error import URLError, HTTPError
-
         settings = svc.get()
         host = (settings.get("jf_host") or "").strip()
         port = (settings.get("jf_port") or "").strip()
@@ -188,66 +264,18 @@ def create_app(test_config: Optional[Dict] = None) -> "Flask":
                 "message": "Stored port must be numeric."
             }), 200
 
-        scheme = "http"
-        if host.startswith(("http://", "https://")):
-            if host.startswith("https://"):
-                scheme = "https"
-                host = host.removeprefix("https://")
-            elif host.startswith("http://"):
-                scheme = "http"
-                host = host.removeprefix("http://")
-
-        url = f"{scheme}://{host}:{port}/System/Info"
-
-        req = Request(url, method="GET")
-        req.add_header("X-Emby-Token", token)
-        req.add_header("Accept", "application/json")
+        scheme, host = split_scheme(host)
 
-        try:
-            with urlopen(req, timeout=3.0) as resp:
-                status = getattr(resp, "status", 200)
-                if 200 <= status < 300:
-                    return jsonify({
-                        "ok": True,
-                        "status": status,
-                        "message": "Connection successful."
-                    }), 200
-                return jsonify({
-                    "ok": False,
-                    "status": status,
-                    "message": f"Jellyfin returned status {status}."
-                }), 200
-        except HTTPError as he:
-            return jsonify({
-                "ok": False,
-                "status": he.code,
-                "message": (
-                    f"HTTP error from Jellyfin ({he.code}): "
-                    f"{he.reason or 'Unknown'}"
-                )
-            }), 200
-        except URLError as ue:
-            reason = getattr(ue, "reason", "Unknown")
-            return jsonify({
-                "ok": False,
-                "status": 0,
-                "message": f"Network error: {reason}"
-            }), 200
-        except Exception as exc:
-            return jsonify({
-                "ok": False,
-                "status": 0,
-                "message": f"Unexpected error: {str(exc)}"
-            }), 200
+        result = jf.probe(f"{scheme}://{host}:{port}", token)
+        if result["ok"]:
+            result["message"] = "Connection successful."
+        return jsonify(result), 200
         
     @app.post("/api/test-connection-with-credentials")
     def test_connection_with_credentials() -> Response:
         """
         Test Jellyfin connectivity with provided credentials.
         """
-        from urllib.request import Request, urlopen
-        from urllib.error import URLError, HTTPError
-
         payload = request.get_json(silent=True) or {}
         host = (payload.get("jf_host") or "").strip()
         port = (payload.get("jf_port") or "").strip()
@@ -270,74 +298,45 @@ def create_app(test_config: Optional[Dict] = None) -> "Flask":
             }), 200
 
         # Parse host to handle http:// or https:// prefixes
-        scheme = "http"
-        if host.startswith(("http://", "https://")):
-            if host.startswith("https://"):
-                scheme = "https"
-                host = host.removeprefix("https://")
-            elif host.startswith("http://"):
-                scheme = "http"
-                host = host.removeprefix("http://")
+        scheme, host = split_scheme(host)
 
-        url = f"{scheme}://{host}:{port}/System/Info"
+        result = jf.probe(f"{scheme}://{host}:{port}", token)
+        return jsonify(result), 200
 
-        req = Request(url, method="GET")
-        req.add_header("X-Emby-Token", token)
-        req.add_header("Accept", "application/json")
+    page_cache: Dict[Tuple[str, str], bytes] = {}
 
-        try:
-            with urlopen(req, timeout=3.0) as resp:
-                status = getattr(resp, "status", 200)
-                if 200 <= status < 300:
-                    return jsonify({
-                        "ok": True,
-                        "status": status,
-                    }), 200
-                return jsonify({
-                    "ok": False,
-                    "status": status,
-                    "message": (
-                        f"Jellyfin returned status {status}."
-                    )
-                }), 200
-        except HTTPError as he:
-            return jsonify({
-                "ok": False,
-                "status": he.code,
-                "message": (
-                    f"HTTP error from Jellyfin ({he.code}): "
-                    f"{he.reason or 'Unknown'}"
-                )
-            }), 200
-        except URLError as ue:
-            reason = getattr(ue, "reason", "Unknown")
-            return jsonify({
-                "ok": False,
-                "status": 0,
-                "message": f"Network error: {reason}"
-            }), 200
-        except Exception as exc:
-            return jsonify({
-                "ok": False,
-                "status": 0,
-                "message": f"Unexpected error: {str(exc)}"
-            }), 200
+    def _render_page(template: str) -> Response:
+        """
+        Render a page template once and reuse the encoded HTML. Pages
+        only depend on the request through url_for links and nav state,
+        which vary with the script root, so output is cached per
+        template and script root. Debug mode bypasses the cache so
+        template edits show up.
+        """
+        if app.jinja_env.auto_reload:
+            return Response(render_template(template), mimetype="text/html")
+        key = (template, request.script_root)
+        body = page_cache.get(key)
+        if body is None:
+            body = render_template(template).encode("utf-8")
+            page_cache[key] = body
+        return Response(body, mimetype="text/html")
 
     @app.get("/")
     def index() -> Response:
-        return render_template("index.html"), 200
+        return _render_page("index.html")
     
     @app.get("/users")
     def users() -> Response:
-        return render_template("users.html"), 200
+        return _render_page("users.html")
     
     @app.get("/libraries")
     def libraries() -> Response:
-        return render_template("libraries.html"), 200
+        return _render_page("libraries.html")
     
     @app.get("/settings")
     def settings() -> Response:
-        return render_template("settings.html"), 200
+        return _render_page("settings.html")
 
     @app.get("/api/jellyfin/system-info")
     def api_jf_system_info() -> Response:
@@ -407,17 +406,32 @@ def create_app(test_config: Optional[Dict] = None) -> "Flask":
 
         return jsonify(result), 200
 
+    def _page_args() -> Tuple[Optional[int], int]:
+        """
+        Read optional limit/offset paging arguments from the query
+        string. Missing or invalid values disable paging.
+        """
+        limit = request.args.get("limit", type=int)
+        if limit is not None and limit < 1:
+            limit = None
+        offset = request.args.get("offset", 0, type=int)
+        return limit, max(offset, 0)
+
     @app.get("/api/analytics/users")
     def api_analytics_users() -> Response:
         """
-        Retrieve all users from repository.
+        Retrieve users from repository, optionally paged with
+        ?limit=&offset=.
         """
-        return jsonify({"ok": True, "data": repo.list_users()}), 200
+        limit, offset = _page_args()
+        users = repo.list_users(limit=limit, offset=offset)
+        return jsonify({"ok": True, "data": users}), 200
 
     @app.get("/api/analytics/libraries")
     def api_analytics_libraries() -> Response:
         """
-        Retrieve all libraries from repository.
+        Retrieve libraries from repository, optionally paged with
+        ?limit=&offset=.
         """
         settings = svc.get()
         
@@ -432,7 +446,10 @@ def create_app(test_config: Optional[Dict] = None) -> "Flask":
             }), 200
         
         try:
-            libraries = repo.list_libraries(include_archived=False)
+            limit, offset = _page_args()
+            libraries = repo.list_libraries(
+                include_archived=False, limit=limit, offset=offset
+            )
             return jsonify({
                 "ok": True,
                 "data": libraries
@@ -6,12 +6,27 @@ Environment Variables
 ---------------------
 HOST: The interface/IP the server should bind to. Defaults to "127.0.0.1".
 PORT: The port number the server should listen on. Defaults to "2929".
+ACCESS_LOG: Set to "1" to log a line per request. Defaults to "0", which
+    skips per-request access log formatting.
 """
 
 from os import getenv
+
+from werkzeug.serving import WSGIRequestHandler
+
 from app import create_app
 
 
+class QuietRequestHandler(WSGIRequestHandler):
+    """
+    Request handler that skips the per-request access log line while
+    still reporting errors.
+    """
+
+    def log_request(self, code="-", size="-") -> None:
+        pass
+
+
 def main() -> None:
     """
     Resolve host and port from env variables, instantiate app via
@@ -19,10 +34,17 @@ def main() -> None:
     """
     host = getenv("HOST", "127.0.0.1")
     port = int(getenv("PORT", "2929"))
+    access_log = getenv("ACCESS_LOG", "0") == "1"
 
     app = create_app()
-    app.run(host=host, port=port)
+    app.run(
+        host=host,
+        port=port,
+        request_handler=(
+            WSGIRequestHandler if access_log else QuietRequestHandler
+        ),
+    )
 
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
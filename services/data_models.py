@@ -4,6 +4,7 @@ Borealis analytics data.
 
 from __future__ import annotations
 
+import json
 from datetime import datetime
 from typing import Dict, Any, Optional
 
@@ -125,6 +126,7 @@ class Item(Base):
     __table_args__ = (
         Index("idx_item_jellyfin_id", "jellyfin_id"),
         Index("idx_item_library_id", "library_id"),
+        Index("idx_item_library_jellyfin", "library_id", "jellyfin_id"),
         Index("idx_item_archived", "archived"),
         Index("idx_item_play_count", "play_count"),
     )
@@ -208,7 +210,6 @@ class TaskLog(Base):
     )
 
     def to_dict(self) -> Dict[str, Any]:
-        import json
         log_data = None
         if self.log_json:
             try:
@@ -6,55 +6,129 @@ authenticated requests to the Jellyfin REST API.
 from __future__ import annotations
 
 import time
+from functools import lru_cache
 from typing import Any, Dict, List, Optional, Tuple
-from urllib.request import Request, urlopen
-from urllib.error import HTTPError, URLError
+from urllib.parse import quote
+
+import requests
+from requests.adapters import HTTPAdapter
+
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads
 
 from services.settings_store import SettingsService
 
 
+@lru_cache(maxsize=64)
+def split_scheme(host: str) -> Tuple[str, str]:
+    """
+    Split an optional http:// or https:// prefix off a configured
+    host, returning (scheme, bare_host). Defaults to http.
+    """
+    if host.startswith("https://"):
+        return "https", host.removeprefix("https://")
+    if host.startswith("http://"):
+        return "http", host.removeprefix("http://")
+    return "http", host
+
+
+def _network_reason(exc: BaseException) -> str:
+    """
+    Return the innermost cause of a requests network error, e.g.
+    "[Errno 111] Connection refused", rather than urllib3's connection
+    pool and retry wrapper text.
+    """
+    seen = set()
+    while id(exc) not in seen:
+        seen.add(id(exc))
+        reason = getattr(exc, "reason", None)
+        if isinstance(reason, BaseException):
+            exc = reason
+        elif exc.args and isinstance(exc.args[0], BaseException):
+            exc = exc.args[0]
+        elif exc.__cause__ is not None:
+            exc = exc.__cause__
+        elif exc.__context__ is not None:
+            exc = exc.__context__
+    return str(exc) or "Unknown"
+
+
+# Seconds a parsed settings tuple is reused before re-reading the store.
+SETTINGS_TTL_SECONDS = 2.0
+
+
 class JellyfinClient:
     def __init__(self, settings: SettingsService) -> None:
         self._settings = settings
+        self._cached: Optional[
+            Tuple[float, Tuple[str, str, str, str]]
+        ] = None
+
+        # Keep-alive session so repeated calls reuse one TCP/TLS
+        # connection. Retries are handled by _get's own backoff loop.
+        self._session = requests.Session()
+        self._session.headers.update({"Accept": "application/json"})
+        adapter = HTTPAdapter(
+            pool_connections=10,
+            pool_maxsize=20,
+            max_retries=0,
+        )
+        self._session.mount("http://", adapter)
+        self._session.mount("https://", adapter)
+
+    def close(self) -> None:
+        """
+        Release pooled HTTP connections.
+        """
+        self._session.close()
+
+    def refresh(self) -> None:
+        """
+        Drop cached settings so the next request re-reads the store.
+        """
+        self._cached = None
 
     def _read_settings(self) -> Tuple[str, str, str, str]:
         """
         Read settings and normalize scheme/host.
+
+        The parsed tuple is cached for SETTINGS_TTL_SECONDS so tight
+        request loops do not hit the settings database on every call.
         """
+        now = time.monotonic()
+        cached = self._cached
+        if cached and now - cached[0] < SETTINGS_TTL_SECONDS:
+            return cached[1]
+
         s = self._settings.get()
         host = (s.get("jf_host") or "").strip()
         port = (s.get("jf_port") or "").strip()
         token = (s.get("jf_api_key") or "").strip()
-        scheme = "http"
+        scheme, host = split_scheme(host)
 
-        if host.startswith(("http://", "https://")):
-            if host.startswith("https://"):
-                scheme = "https"
-                host = host.removeprefix("https://")
-            else:
-                host = host.removeprefix("http://")
+        parsed = (scheme, host, port, token)
+        self._cached = (now, parsed)
+        return parsed
 
-        return scheme, host, port, token
-
-    def _build_url(self, path: str) -> Optional[str]:
+    def _build_url(
+        self, path: str, settings: Tuple[str, str, str, str]
+    ) -> Optional[str]:
         """
         Construct a full URL for a given Jellyfin path.
         """
-        scheme, host, port, token = self._read_settings()
+        scheme, host, port, token = settings
         if not host or not port or not port.isdigit() or not token:
             return None
         base = f"{scheme}://{host}:{port}"
         return f"{base}{path}"
 
-    def _is_transient_error(self, exc: Exception) -> bool:
+    def _is_transient_status(self, status: int) -> bool:
         """
-        Determine if an error is transient and should be retried.
+        Determine if an HTTP status is transient and should be retried.
         """
-        if isinstance(exc, HTTPError):
-            return exc.code in (408, 429, 500, 502, 503, 504)
-        if isinstance(exc, URLError):
-            return True
-        return False
+        return status in (408, 429, 500, 502, 503, 504)
 
     def _get(
         self,
@@ -65,7 +139,8 @@ class JellyfinClient:
         """
         Perform a GET request to Jellyfin.
         """
-        url = self._build_url(path)
+        settings = self._read_settings()
+        url = self._build_url(path, settings)
         if not url:
             return {
                 "ok": False,
@@ -75,22 +150,32 @@ class JellyfinClient:
                 ),
             }
 
-        _, _, _, token = self._read_settings()
-
-        req = Request(url, method="GET")
-        req.add_header("X-Emby-Token", token)
-        req.add_header("Accept", "application/json")
+        token = settings[3]
 
-        last_exception = None
+        last_status: Optional[int] = None
+        last_reason = "Unknown"
         for attempt in range(max_retries):
             try:
-                with urlopen(req, timeout=5.0) as resp:
-                    status = getattr(resp, "status", 200)
-                    data = resp.read()
-                    import json
+                resp = self._session.get(
+                    url,
+                    headers={"X-Emby-Token": token},
+                    timeout=5.0,
+                )
+            except (requests.ConnectionError, requests.Timeout) as exc:
+                last_status = 0
+                last_reason = _network_reason(exc)
+            except Exception as exc:
+                return {
+                    "ok": False,
+                    "status": 0,
+                    "message": f"Unexpected error: {str(exc)}",
+                }
+            else:
+                status = resp.status_code
+                if status < 400:
                     try:
-                        parsed = json.loads(data.decode("utf-8"))
-                    except Exception:
+                        parsed = _json_loads(resp.content)
+                    except ValueError:
                         parsed = {}
 
                     return {
@@ -98,58 +183,41 @@ class JellyfinClient:
                         "status": status,
                         "data": parsed,
                     }
-            except HTTPError as he:
-                last_exception = he
-                if not self._is_transient_error(he):
+
+                if not self._is_transient_status(status):
                     return {
                         "ok": False,
-                        "status": he.code,
+                        "status": status,
                         "message": (
-                            f"HTTP error from Jellyfin ({he.code}): "
-                            f"{he.reason or 'Unknown'}"
+                            f"HTTP error from Jellyfin ({status}): "
+                            f"{resp.reason or 'Unknown'}"
                         ),
                     }
-            except URLError as ue:
-                last_exception = ue
-                if not self._is_transient_error(ue):
-                    reason = getattr(ue, "reason", "Unknown")
-                    return {
-                        "ok": False,
-                        "status": 0,
-                        "message": f"Network error: {reason}",
-                    }
-            except Exception as exc:
-                return {
-                    "ok": False,
-                    "status": 0,
-                    "message": f"Unexpected error: {str(exc)}",
-                }
+                last_status = status
+                last_reason = resp.reason or "Unknown"
 
             if attempt < max_retries - 1:
                 delay = backoff_base * (2 ** attempt)
                 time.sleep(delay)
 
-        if last_exception:
-            if isinstance(last_exception, HTTPError):
-                return {
-                    "ok": False,
-                    "status": last_exception.code,
-                    "message": (
-                        f"HTTP error after {max_retries} retries "
-                        f"({last_exception.code}): "
-                        f"{last_exception.reason or 'Unknown'}"
-                    ),
-                }
-            elif isinstance(last_exception, URLError):
-                reason = getattr(last_exception, "reason", "Unknown")
-                return {
-                    "ok": False,
-                    "status": 0,
-                    "message": (
-                        f"Network error after {max_retries} retries: "
-                        f"{reason}"
-                    ),
-                }
+        if last_status:
+            return {
+                "ok": False,
+                "status": last_status,
+                "message": (
+                    f"HTTP error after {max_retries} retries "
+                    f"({last_status}): {last_reason}"
+                ),
+            }
+        if last_status == 0:
+            return {
+                "ok": False,
+                "status": 0,
+                "message": (
+                    f"Network error after {max_retries} retries: "
+                    f"{last_reason}"
+                ),
+            }
 
         return {
             "ok": False,
@@ -157,6 +225,50 @@ class JellyfinClient:
             "message": f"Failed after {max_retries} retries",
         }
 
+    def probe(
+        self, base_url: str, token: str, timeout: float = 3.0
+    ) -> Dict[str, Any]:
+        """
+        Single-attempt /System/Info check against explicit credentials,
+        used to test settings before or after saving them.
+        """
+        try:
+            resp = self._session.get(
+                f"{base_url}/System/Info",
+                headers={"X-Emby-Token": token},
+                timeout=timeout,
+            )
+        except (requests.ConnectionError, requests.Timeout) as exc:
+            return {
+                "ok": False,
+                "status": 0,
+                "message": f"Network error: {_network_reason(exc)}",
+            }
+        except Exception as exc:
+            return {
+                "ok": False,
+                "status": 0,
+                "message": f"Unexpected error: {str(exc)}",
+            }
+
+        status = resp.status_code
+        if status >= 400:
+            return {
+                "ok": False,
+                "status": status,
+                "message": (
+                    f"HTTP error from Jellyfin ({status}): "
+                    f"{resp.reason or 'Unknown'}"
+                ),
+            }
+        if not 200 <= status < 300:
+            return {
+                "ok": False,
+                "status": status,
+                "message": f"Jellyfin returned status {status}.",
+            }
+        return {"ok": True, "status": status}
+
     def validate_connection(self) -> Dict[str, Any]:
         """
         Calls /System/Info to validate connectivity and credentials.
@@ -227,7 +339,6 @@ class JellyfinClient:
         )
 
         if min_date:
-            from urllib.parse import quote
             encoded_date = quote(min_date, safe='')
             path += f"&minDate={encoded_date}"
 
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import time
+from datetime import datetime
 from typing import Dict, Any, List, Optional
 
 
@@ -143,7 +145,6 @@ def map_playback_event(
 
     activity_timestamp = jf_event.get("Date")
     if activity_timestamp:
-        from datetime import datetime
         try:
             # Handle ISO 8601 format with Z suffix
             dt = datetime.fromisoformat(
@@ -151,10 +152,8 @@ def map_playback_event(
             )
             activity_at = int(dt.timestamp())
         except Exception:
-            import time
             activity_at = int(time.time())
     else:
-        import time
         activity_at = int(time.time())
 
     return {
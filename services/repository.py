@@ -1,11 +1,13 @@
 from __future__ import annotations
 
+import json
 import time
 from dataclasses import dataclass
-from typing import List, Dict, Any, Optional
+from typing import Any, ClassVar, Dict, List, Optional, Set
 from contextlib import contextmanager
 
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, text, update
+from sqlalchemy.dialects.sqlite import insert
 from sqlalchemy.orm import sessionmaker, Session
 
 from services.data_models import (
@@ -16,6 +18,31 @@ from services.data_models import (
     PlaybackActivity,
     TaskLog
 )
+from services.sqlite_tuning import apply_sqlite_pragmas
+
+
+# Max bound parameters per IN clause, below SQLite's historical 999 limit.
+_IN_CHUNK_SIZE = 500
+
+# Connection tuning for write-heavy sync workloads.
+_SQLITE_PRAGMAS = (
+    "journal_mode=WAL",
+    "synchronous=NORMAL",
+    "temp_store=MEMORY",
+    "mmap_size=268435456",
+    "cache_size=-64000",
+)
+
+
+def _paginate(query, limit: Optional[int], offset: int):
+    """
+    Apply optional offset/limit paging to a query.
+    """
+    if offset:
+        query = query.offset(offset)
+    if limit is not None:
+        query = query.limit(limit)
+    return query
 
 
 @dataclass
@@ -26,12 +53,44 @@ class Repository:
 
     database_url: str = "sqlite:///borealis_data.db"
 
+    # Database URLs whose schema has already been created by this process.
+    _schema_ready: ClassVar[Set[str]] = set()
+
     def __post_init__(self) -> None:
-        self.engine = create_engine(self.database_url, future=True)
+        is_sqlite = self.database_url.startswith("sqlite")
+        self.engine = create_engine(
+            self.database_url,
+            future=True,
+            pool_pre_ping=True,
+            connect_args=(
+                {"check_same_thread": False} if is_sqlite else {}
+            ),
+        )
+        if is_sqlite:
+            apply_sqlite_pragmas(self.engine, _SQLITE_PRAGMAS)
         self.SessionLocal = sessionmaker(
             bind=self.engine, expire_on_commit=False
         )
+        self._init_schema()
+
+    def _init_schema(self) -> None:
+        """
+        Create tables and indexes once per database per process.
+
+        In-memory SQLite URLs are always initialized because every
+        engine gets its own fresh database.
+        """
+        url = self.database_url
+        if url in Repository._schema_ready:
+            return
         Base.metadata.create_all(self.engine)
+        # create_all only builds indexes together with new tables, so
+        # add indexes declared after an existing database was created
+        for table in Base.metadata.sorted_tables:
+            for index in table.indexes:
+                index.create(self.engine, checkfirst=True)
+        if ":memory:" not in url and url != "sqlite://":
+            Repository._schema_ready.add(url)
 
     @contextmanager
     def _session(self):
@@ -46,6 +105,38 @@ class Repository:
         finally:
             session.close()
 
+    def _archive_missing(
+        self, model, active_jellyfin_ids: List[str], *criteria
+    ) -> int:
+        """
+        Archive unarchived rows of model whose jellyfin_id is not in
+        the active list.
+
+        The difference is computed in Python and applied in chunks so
+        large syncs never bind more IN parameters than SQLite allows.
+        """
+        active = set(active_jellyfin_ids)
+
+        with self._session() as session:
+            current = (
+                session.query(model.jellyfin_id)
+                .filter(model.archived == False, *criteria)
+                .all()
+            )
+            missing = [
+                jf_id for (jf_id,) in current if jf_id not in active
+            ]
+
+            archived = 0
+            for start in range(0, len(missing), _IN_CHUNK_SIZE):
+                chunk = missing[start:start + _IN_CHUNK_SIZE]
+                archived += (
+                    session.query(model)
+                    .filter(model.jellyfin_id.in_(chunk))
+                    .update({"archived": True}, synchronize_session=False)
+                )
+            return archived
+
     # Users
 
     def upsert_users(self, user_dicts: List[Dict[str, Any]]) -> int:
@@ -55,38 +146,37 @@ class Repository:
         if not user_dicts:
             return 0
 
-        count = 0
         now = int(time.time())
+        rows = [
+            {
+                "jellyfin_id": jf_id,
+                "name": get("name", "Unknown"),
+                "is_admin": get("is_admin", False),
+                "archived": False,
+                "created_at": now,
+                "updated_at": now,
+            }
+            for data in user_dicts
+            if (jf_id := (get := data.get)("jellyfin_id"))
+        ]
+        if not rows:
+            return 0
+
+        stmt = insert(User)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[User.jellyfin_id],
+            set_={
+                "name": stmt.excluded.name,
+                "is_admin": stmt.excluded.is_admin,
+                "archived": False,
+                "updated_at": stmt.excluded.updated_at,
+            },
+        )
 
         with self._session() as session:
-            for data in user_dicts:
-                jf_id = data.get("jellyfin_id")
-                if not jf_id:
-                    continue
-
-                user = session.query(User).filter_by(
-                    jellyfin_id=jf_id
-                ).first()
-
-                if user:
-                    user.name = data.get("name", user.name)
-                    user.is_admin = data.get("is_admin", user.is_admin)
-                    user.archived = False
-                    user.updated_at = now
-                else:
-                    user = User(
-                        jellyfin_id=jf_id,
-                        name=data.get("name", "Unknown"),
-                        is_admin=data.get("is_admin", False),
-                        archived=False,
-                        created_at=now,
-                        updated_at=now,
-                    )
-
-                session.merge(user)
-                count += 1
-
-        return count
+            session.execute(stmt, rows)
+
+        return len(rows)
 
     def archive_missing_users(
         self, active_jellyfin_ids: List[str]
@@ -97,25 +187,22 @@ class Repository:
         if not active_jellyfin_ids:
             return 0
 
-        with self._session() as session:
-            result = (
-                session.query(User)
-                .filter(User.jellyfin_id.notin_(active_jellyfin_ids))
-                .filter(User.archived == False)
-                .update({"archived": True}, synchronize_session=False)
-            )
-            return result
+        return self._archive_missing(User, active_jellyfin_ids)
 
     def list_users(
-        self, include_archived: bool = False
+        self,
+        include_archived: bool = False,
+        limit: Optional[int] = None,
+        offset: int = 0,
     ) -> List[Dict[str, Any]]:
         """
-        Retrieve all users as dictionaries.
+        Retrieve users as dictionaries, optionally one page at a time.
         """
         with self._session() as session:
             query = session.query(User)
             if not include_archived:
                 query = query.filter(User.archived == False)
+            query = _paginate(query.order_by(User.id), limit, offset)
             return [u.to_dict() for u in query.all()]
 
     # Libraries
@@ -129,41 +216,40 @@ class Repository:
         if not library_dicts:
             return 0
 
-        count = 0
         now = int(time.time())
+        rows = [
+            {
+                "jellyfin_id": jf_id,
+                "name": get("name", "Unknown"),
+                "type": get("type"),
+                "image_url": get("image_url"),
+                "tracked": False,
+                "archived": False,
+                "created_at": now,
+                "updated_at": now,
+            }
+            for data in library_dicts
+            if (jf_id := (get := data.get)("jellyfin_id"))
+        ]
+        if not rows:
+            return 0
+
+        stmt = insert(Library)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[Library.jellyfin_id],
+            set_={
+                "name": stmt.excluded.name,
+                "type": stmt.excluded.type,
+                "image_url": stmt.excluded.image_url,
+                "archived": False,
+                "updated_at": stmt.excluded.updated_at,
+            },
+        )
 
         with self._session() as session:
-            for data in library_dicts:
-                jf_id = data.get("jellyfin_id")
-                if not jf_id:
-                    continue
-
-                lib = session.query(Library).filter_by(
-                    jellyfin_id=jf_id
-                ).first()
-
-                if lib:
-                    lib.name = data.get("name", lib.name)
-                    lib.type = data.get("type", lib.type)
-                    lib.image_url = data.get("image_url", lib.image_url)
-                    lib.archived = False
-                    lib.updated_at = now
-                else:
-                    lib = Library(
-                        jellyfin_id=jf_id,
-                        name=data.get("name", "Unknown"),
-                        type=data.get("type"),
-                        image_url=data.get("image_url"),
-                        tracked=False,
-                        archived=False,
-                        created_at=now,
-                        updated_at=now,
-                    )
-
-                session.merge(lib)
-                count += 1
-
-        return count
+            session.execute(stmt, rows)
+
+        return len(rows)
 
     def archive_missing_libraries(
         self, active_jellyfin_ids: List[str]
@@ -174,25 +260,22 @@ class Repository:
         if not active_jellyfin_ids:
             return 0
 
-        with self._session() as session:
-            result = (
-                session.query(Library)
-                .filter(Library.jellyfin_id.notin_(active_jellyfin_ids))
-                .filter(Library.archived == False)
-                .update({"archived": True}, synchronize_session=False)
-            )
-            return result
+        return self._archive_missing(Library, active_jellyfin_ids)
 
     def list_libraries(
-        self, include_archived: bool = False
+        self,
+        include_archived: bool = False,
+        limit: Optional[int] = None,
+        offset: int = 0,
     ) -> List[Dict[str, Any]]:
         """
-        Retrieve all libraries as dictionaries.
+        Retrieve libraries as dictionaries, optionally one page at a time.
         """
         with self._session() as session:
             query = session.query(Library)
             if not include_archived:
                 query = query.filter(Library.archived == False)
+            query = _paginate(query.order_by(Library.id), limit, offset)
             return [lib.to_dict() for lib in query.all()]
 
     def set_library_tracked(
@@ -209,9 +292,6 @@ class Repository:
                 return None
 
             lib.tracked = bool(tracked)
-            session.merge(lib)
-            session.commit()
-            session.refresh(lib)
             return lib.to_dict()
 
     # Items
@@ -223,42 +303,41 @@ class Repository:
         if not item_dicts:
             return 0
 
-        count = 0
         now = int(time.time())
+        rows = [
+            {
+                "jellyfin_id": jf_id,
+                "library_id": lib_id,
+                "parent_id": get("parent_id"),
+                "name": get("name", "Unknown"),
+                "type": get("type"),
+                "archived": False,
+                "created_at": now,
+                "updated_at": now,
+            }
+            for data in item_dicts
+            if (jf_id := (get := data.get)("jellyfin_id"))
+            and (lib_id := get("library_id")) is not None
+        ]
+        if not rows:
+            return 0
+
+        stmt = insert(Item)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[Item.jellyfin_id],
+            set_={
+                "name": stmt.excluded.name,
+                "type": stmt.excluded.type,
+                "parent_id": stmt.excluded.parent_id,
+                "archived": False,
+                "updated_at": stmt.excluded.updated_at,
+            },
+        )
 
         with self._session() as session:
-            for data in item_dicts:
-                jf_id = data.get("jellyfin_id")
-                lib_id = data.get("library_id")
-                if not jf_id or lib_id is None:
-                    continue
-
-                item = session.query(Item).filter_by(
-                    jellyfin_id=jf_id
-                ).first()
-
-                if item:
-                    item.name = data.get("name", item.name)
-                    item.type = data.get("type", item.type)
-                    item.parent_id = data.get("parent_id", item.parent_id)
-                    item.archived = False
-                    item.updated_at = now
-                else:
-                    item = Item(
-                        jellyfin_id=jf_id,
-                        library_id=lib_id,
-                        parent_id=data.get("parent_id"),
-                        name=data.get("name", "Unknown"),
-                        type=data.get("type"),
-                        archived=False,
-                        created_at=now,
-                        updated_at=now,
-                    )
-
-                session.merge(item)
-                count += 1
-
-        return count
+            session.execute(stmt, rows)
+
+        return len(rows)
 
     def archive_missing_items(
         self, library_id: int, active_jellyfin_ids: List[str]
@@ -269,15 +348,11 @@ class Repository:
         if not active_jellyfin_ids:
             return 0
 
-        with self._session() as session:
-            result = (
-                session.query(Item)
-                .filter(Item.library_id == library_id)
-                .filter(Item.jellyfin_id.notin_(active_jellyfin_ids))
-                .filter(Item.archived == False)
-                .update({"archived": True}, synchronize_session=False)
-            )
-            return result
+        return self._archive_missing(
+            Item,
+            active_jellyfin_ids,
+            Item.library_id == library_id,
+        )
         
     def refresh_play_stats(self) -> Dict[str, int]:
         """
@@ -290,6 +365,13 @@ class Repository:
             result = StatsAggregator.refresh_all_stats(session)
             return result
         
+    def analyze(self) -> None:
+        """
+        Refresh query planner statistics after large bulk loads.
+        """
+        with self._session() as session:
+            session.execute(text("ANALYZE"))
+
     def get_top_items_by_plays(
         self,
         limit: int = 10
@@ -376,8 +458,6 @@ class Repository:
                 )
                 if settings:
                     settings.last_activity_log_sync = timestamp
-                    session.merge(settings)
-                    session.commit()
         except Exception:
             pass
     
@@ -419,41 +499,34 @@ class Repository:
         if not event_dicts:
             return 0
 
-        count = 0
-        with self._session() as session:
-            for event in event_dicts:
-                activity_log_id = event.get("activity_log_id")
-                user_id = event.get("user_id")
-                item_id = event.get("item_id")
-
-                if not activity_log_id or not user_id or not item_id:
-                    continue
-
-                existing = (
-                    session.query(PlaybackActivity)
-                    .filter_by(activity_log_id=activity_log_id)
-                    .first()
-                )
-                if existing:
-                    # Already synced, skip
-                    continue
-
-                activity = PlaybackActivity(
-                    activity_log_id=activity_log_id,
-                    user_id=user_id,
-                    item_id=item_id,
-                    event_name=event.get("event_name"),
-                    event_overview=event.get("event_overview"),
-                    activity_at=event.get("activity_at"),
-                    username_denorm=event.get("username_denorm"),
-                )
-
-                session.add(activity)
-                count += 1
+        now = int(time.time())
+        rows = [
+            {
+                "activity_log_id": log_id,
+                "user_id": user_id,
+                "item_id": item_id,
+                "event_name": get("event_name"),
+                "event_overview": get("event_overview"),
+                "activity_at": get("activity_at") or now,
+                "username_denorm": get("username_denorm"),
+            }
+            for event in event_dicts
+            if (log_id := (get := event.get)("activity_log_id"))
+            and (user_id := get("user_id"))
+            and (item_id := get("item_id"))
+        ]
+        if not rows:
+            return 0
 
-            session.commit()
+        # Events that were already synced are skipped by the unique
+        # activity_log_id constraint; rowcount reports only new rows.
+        stmt = insert(PlaybackActivity.__table__).on_conflict_do_nothing(
+            index_elements=["activity_log_id"]
+        )
 
-        return count
+        with self._session() as session:
+            result = session.execute(stmt, rows)
+            return result.rowcount
 
     # Task Logging
 
@@ -487,19 +560,18 @@ class Repository:
         """
         Mark a task log as complete with result.
         """
-        import json
-
         now = int(time.time())
-        with self._session() as session:
-            task = session.query(TaskLog).filter_by(id=task_id).first()
-            if not task:
-                return
+        values: Dict[str, Any] = {
+            "finished_at": now,
+            "duration_ms": (now - TaskLog.started_at) * 1000,
+            "result": result,
+        }
+        if log_data:
+            values["log_json"] = json.dumps(log_data)
 
-            task.finished_at = now
-            task.duration_ms = (now - task.started_at) * 1000
-            task.result = result
-
-            if log_data:
-                task.log_json = json.dumps(log_data)
-
-            session.merge(task)
\ No newline at end of file
+        with self._session() as session:
+            session.execute(
+                update(TaskLog)
+                .where(TaskLog.id == task_id)
+                .values(**values)
+            )
@@ -4,16 +4,60 @@ Settings storage using SQLAlchemy with Fernet encryption for sensitive fields.
 
 from __future__ import annotations
 
+import contextlib
+import os
+import tempfile
+import threading
 from dataclasses import dataclass
-from pathlib import Path
 from typing import Optional, Dict, Any
 
 from sqlalchemy import create_engine, Column, Integer, String
 from sqlalchemy.orm import declarative_base, sessionmaker, Session
 from cryptography.fernet import Fernet, InvalidToken
 
+from services.sqlite_tuning import apply_sqlite_pragmas
+
 Base = declarative_base()
 
+_HOUR_FORMATS = frozenset({"12", "24"})
+# Plain string settings copied as-is by SettingsService.update
+_STRING_FIELDS = ("language", "jf_host", "jf_port")
+# WAL journaling with relaxed fsync for settings writes
+_SQLITE_PRAGMAS = ("journal_mode=WAL", "synchronous=NORMAL")
+
+
+def _write_key_file(key_path: str, key: bytes) -> None:
+    """
+    Create key_path holding key with owner-only permissions, raising
+    FileExistsError if it already exists.
+
+    The key is written to a temp file and hard-linked into place so the
+    key file never appears half-written. Filesystems without hard links
+    fall back to an exclusive create followed by a write.
+    """
+    # mkstemp creates the file with owner-only permissions
+    fd, tmp_path = tempfile.mkstemp(
+        dir=os.path.dirname(os.path.abspath(key_path)),
+        prefix=".key-",
+    )
+    try:
+        with os.fdopen(fd, "wb") as fh:
+            fh.write(key)
+        os.link(tmp_path, key_path)
+        return
+    except FileExistsError:
+        raise
+    except OSError:
+        # Hard links unsupported (FAT/exFAT, some network mounts)
+        pass
+    finally:
+        with contextlib.suppress(OSError):
+            os.unlink(tmp_path)
+
+    fd = os.open(key_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+    with os.fdopen(fd, "wb") as fh:
+        fh.write(key)
+
 
 class Settings(Base):
     __tablename__ = "settings"
@@ -57,10 +101,22 @@ class SettingsService:
     encryption_key_path: str
 
     def __post_init__(self) -> None:
-        self.engine = create_engine(self.database_url, future=True)
+        is_sqlite = self.database_url.startswith("sqlite")
+        self.engine = create_engine(
+            self.database_url,
+            future=True,
+            connect_args=(
+                {"check_same_thread": False} if is_sqlite else {}
+            ),
+        )
+        if is_sqlite:
+            apply_sqlite_pragmas(self.engine, _SQLITE_PRAGMAS)
         self.SessionLocal = sessionmaker(bind=self.engine, expire_on_commit=False)
         Base.metadata.create_all(self.engine)
         self.fernet = Fernet(self._load_or_create_key())
+        # Decrypted settings, written through on update()
+        self._cached: Optional[Dict[str, Any]] = None
+        self._cache_lock = threading.Lock()
 
     def _load_or_create_key(self) -> bytes:
         """
@@ -70,45 +126,54 @@ class SettingsService:
         if key_path == ":memory:" or not key_path:
             return Fernet.generate_key()
 
-        key_file = Path(key_path)
-        if key_file.exists():
-            return key_file.read_bytes()
+        try:
+            with open(key_path, "rb") as fh:
+                return fh.read()
+        except FileNotFoundError:
+            pass
+
         key = Fernet.generate_key()
         try:
-            key_file.write_bytes(key)
-        except Exception:
+            _write_key_file(key_path, key)
+        except FileExistsError:
+            # Created concurrently by another process; use its key
+            with open(key_path, "rb") as fh:
+                return fh.read()
+        except OSError:
+            # Key cannot be persisted here; keep it for this process only
             pass
         return key
 
     def get(self) -> Dict[str, Any]:
         """
         Retrieve current settings.
+
+        Served from memory after the first read; this service is the
+        only writer, so update() keeps the cached copy current.
         """
-        with self._session() as session:
-            settings = self._get_or_create_row(session)
-            return settings.to_dict(self.fernet)
+        cached = self._cached
+        if cached is None:
+            with self._cache_lock, self._session() as session:
+                settings = self._get_or_create_row(session)
+                cached = settings.to_dict(self.fernet)
+                self._cached = cached
+        return dict(cached)
 
     def update(self, values: Dict[str, Any]) -> Dict[str, Any]:
         """
         Update settings. Handles encryption for jf_api_key automatically.
         Unknown keys are ignored.
         """
-        allowed = {"hour_format", "language", "jf_host", "jf_port", "jf_api_key"}
-        clean: Dict[str, Any] = {k: v for k, v in values.items() if k in allowed}
-
-        with self._session() as session:
-            settings = self._get_or_create_row(session)
-            if "hour_format" in clean and clean["hour_format"] in {"12", "24"}:
-                settings.hour_format = clean["hour_format"]
-            if "language" in clean and isinstance(clean["language"], str):
-                settings.language = clean["language"]
-            if "jf_host" in clean and isinstance(clean["jf_host"], str):
-                settings.jf_host = clean["jf_host"]
-            if "jf_port" in clean and isinstance(clean["jf_port"], str):
-                settings.jf_port = clean["jf_port"]
-
-            if "jf_api_key" in clean:
-                api = clean["jf_api_key"]
+        with self._cache_lock, self._session() as session:
+            settings = self._get_or_create_row(session, commit=False)
+            if values.get("hour_format") in _HOUR_FORMATS:
+                settings.hour_format = values["hour_format"]
+            for key in _STRING_FIELDS:
+                if isinstance(values.get(key), str):
+                    setattr(settings, key, values[key])
+
+            if "jf_api_key" in values:
+                api = values["jf_api_key"]
 
                 # Prevent accidental overwrite with masked asterisks
                 if isinstance(api, str) and api == "*" * 32:
@@ -119,20 +184,30 @@ class SettingsService:
                 else:
                     settings.jf_api_key_encrypted = None
 
-            session.add(settings)
             session.commit()
-            session.refresh(settings)
-            return settings.to_dict(self.fernet)
+            result = settings.to_dict(self.fernet)
+            self._cached = result
+
+        return dict(result)
 
     def _session(self) -> Session:
         return self.SessionLocal()
 
-    def _get_or_create_row(self, session: Session) -> Settings:
+    def _get_or_create_row(
+        self, session: Session, commit: bool = True
+    ) -> Settings:
+        """
+        Return the settings row, inserting defaults if none exists.
+        With commit=False the insert is only flushed, so the caller can
+        apply further changes in the same transaction.
+        """
         obj = session.query(Settings).first()
         if obj:
             return obj
         obj = Settings()
         session.add(obj)
-        session.commit()
-        session.refresh(obj)
+        if commit:
+            session.commit()
+        else:
+            session.flush()
         return obj
\ No newline at end of file
@@ -0,0 +1,27 @@
+"""
+Per-connection SQLite tuning shared by the settings and data engines.
+"""
+
+from __future__ import annotations
+
+from typing import Sequence
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+
+def apply_sqlite_pragmas(engine: Engine, pragmas: Sequence[str]) -> None:
+    """
+    Run each "name=value" PRAGMA on every new connection of the engine.
+    """
+    pragmas = tuple(pragmas)
+
+    def _on_connect(dbapi_connection, _connection_record) -> None:
+        cursor = dbapi_connection.cursor()
+        try:
+            for pragma in pragmas:
+                cursor.execute(f"PRAGMA {pragma}")
+        finally:
+            cursor.close()
+
+    event.listen(engine, "connect", _on_connect)
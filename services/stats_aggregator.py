@@ -6,6 +6,7 @@ playback activity events.
 from __future__ import annotations
 
 from typing import Dict, Any, List
+from sqlalchemy import func, select, update
 from sqlalchemy.orm import Session
 
 from services.data_models import (
@@ -17,70 +18,72 @@ from services.data_models import (
 
 
 class StatsAggregator:
+    @staticmethod
     def refresh_user_play_counts(session: Session) -> int:
         """
         Refresh total_plays count for all users based on
         PlaybackActivity records.
         """
-        users = session.query(User).all()
-        updated = 0
-
-        for user in users:
-            play_count = (
-                session.query(PlaybackActivity)
-                .filter(PlaybackActivity.user_id == user.jellyfin_id)
-                .count()
-            )
-            user.total_plays = play_count
-            updated += 1
-
-        return updated
+        plays = (
+            select(func.count(PlaybackActivity.id))
+            .where(PlaybackActivity.user_id == User.jellyfin_id)
+            .scalar_subquery()
+        )
+        result = session.execute(
+            update(User)
+            .values(total_plays=plays)
+            .execution_options(synchronize_session=False)
+        )
+        return result.rowcount
 
+    @staticmethod
     def refresh_item_play_counts(session: Session) -> int:
         """
         Refresh play_count for all items based on
         PlaybackActivity records.
         """
-        items = session.query(Item).all()
-        updated = 0
-
-        for item in items:
-            play_count = (
-                session.query(PlaybackActivity)
-                .filter(PlaybackActivity.item_id == item.jellyfin_id)
-                .count()
-            )
-            item.play_count = play_count
-            updated += 1
-
-        return updated
+        plays = (
+            select(func.count(PlaybackActivity.id))
+            .where(PlaybackActivity.item_id == Item.jellyfin_id)
+            .scalar_subquery()
+        )
+        result = session.execute(
+            update(Item)
+            .values(play_count=plays)
+            .execution_options(synchronize_session=False)
+        )
+        return result.rowcount
 
+    @staticmethod
     def refresh_library_play_counts(session: Session) -> int:
         """
         Refresh total_plays count for all libraries based on
         PlaybackActivity records for their items.
         """
-        libraries = session.query(Library).all()
-        updated = 0
-
-        for lib in libraries:
-            play_count = (
-                session.query(PlaybackActivity)
-                .join(
-                    Item,
-                    PlaybackActivity.item_id == Item.jellyfin_id
-                )
-                .filter(Item.library_id == lib.id)
-                .count()
+        plays = (
+            select(func.count(PlaybackActivity.id))
+            .select_from(PlaybackActivity)
+            .join(
+                Item,
+                PlaybackActivity.item_id == Item.jellyfin_id
             )
-            lib.total_plays = play_count
-            updated += 1
-
-        return updated
+            .where(Item.library_id == Library.id)
+            .scalar_subquery()
+        )
+        result = session.execute(
+            update(Library)
+            .values(total_plays=plays)
+            .execution_options(synchronize_session=False)
+        )
+        return result.rowcount
 
+    @staticmethod
     def refresh_all_stats(session: Session) -> Dict[str, int]:
         """
         Refresh all denormalized statistics in a single operation.
+
+        All three refreshes share the caller's session, so they are
+        committed together as one transaction.
         """
         return {
             "users_updated": (
@@ -94,6 +97,7 @@ class StatsAggregator:
             ),
         }
 
+    @staticmethod
     def get_top_items_by_plays(
         session: Session,
         limit: int = 10
@@ -110,6 +114,7 @@ class StatsAggregator:
         )
         return [item.to_dict() for item in items]
 
+    @staticmethod
     def get_top_users_by_plays(
         session: Session,
         limit: int = 10
@@ -126,6 +131,7 @@ class StatsAggregator:
         )
         return [user.to_dict() for user in users]
 
+    @staticmethod
     def get_library_stats(
         session: Session,
         include_archived: bool = False
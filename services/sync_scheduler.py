@@ -4,7 +4,6 @@ Background scheduler that runs periodic sync operations.
 
 from __future__ import annotations
 
-import time
 import threading
 from dataclasses import dataclass
 from typing import Optional
@@ -27,6 +26,7 @@ class SyncScheduler:
     def __post_init__(self) -> None:
         self._running = False
         self._thread: Optional[threading.Thread] = None
+        self._stop_event = threading.Event()
 
     def start(self) -> None:
         """Start the background sync thread."""
@@ -34,6 +34,7 @@ class SyncScheduler:
             return
 
         self._running = True
+        self._stop_event.clear()
         self._thread = threading.Thread(
             target=self._run_loop,
             daemon=True
@@ -47,6 +48,7 @@ class SyncScheduler:
     def stop(self) -> None:
         """Stop the background sync thread."""
         self._running = False
+        self._stop_event.set()
         if self._thread:
             self._thread.join(timeout=5)
         print("SyncScheduler stopped")
@@ -55,7 +57,7 @@ class SyncScheduler:
         """
         Main loop that runs sync operations periodically.
         """
-        while self._running:
+        while not self._stop_event.is_set():
             try:
                 # Phase 1: Full sync of users, libraries, items
                 full_result = (
@@ -93,7 +95,5 @@ class SyncScheduler:
             except Exception as exc:
                 print(f"Scheduled sync error: {exc}")
 
-            for _ in range(self.interval_seconds):
-                if not self._running:
-                    break
-                time.sleep(1)
\ No newline at end of file
+            if self._stop_event.wait(self.interval_seconds):
+                break
\ No newline at end of file
@@ -4,6 +4,7 @@ import time
 from datetime import datetime, timezone
 import json
 import traceback
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from typing import Dict, Any, List, Optional
 
@@ -13,6 +14,7 @@ from services.mappers import (
     map_users,
     map_libraries,
     map_items,
+    map_playback_events,
 )
 
 
@@ -43,6 +45,28 @@ class SyncResult:
 class SyncService:
     jellyfin_client: JellyfinClient
     repository: Repository
+    max_fetch_workers: int = 8
+
+    def _fetch_library_items(
+        self, library_ids: List[str]
+    ) -> List[Dict[str, Any]]:
+        """
+        Fetch item listings for several libraries concurrently.
+
+        Only the HTTP requests run in parallel; results are returned
+        in input order so database writes stay on the calling thread.
+        """
+        if len(library_ids) <= 1:
+            return [
+                self.jellyfin_client.library_items(lib_id)
+                for lib_id in library_ids
+            ]
+
+        workers = min(self.max_fetch_workers, len(library_ids))
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            return list(
+                pool.map(self.jellyfin_client.library_items, library_ids)
+            )
     
     def sync_full(self, auto_track: bool = False) -> SyncResult:
         """
@@ -126,21 +150,20 @@ class SyncService:
                 )
                 
                 # Phase 3: Sync items for each tracked library
-                tracked_libs = self.repository.list_libraries(
-                    include_archived=False
+                tracked_libs = [
+                    lib for lib in self.repository.list_libraries(
+                        include_archived=False
+                    )
+                    if lib.get("tracked")
+                ]
+
+                items_results = self._fetch_library_items(
+                    [lib["jellyfin_id"] for lib in tracked_libs]
                 )
-                
-                for lib in tracked_libs:
-                    if not lib.get("tracked"):
-                        continue
-                    
-                    lib_jf_id = lib["jellyfin_id"]
+
+                for lib, items_result in zip(tracked_libs, items_results):
                     lib_internal_id = lib["id"]
-                    
-                    items_result = self.jellyfin_client.library_items(
-                        lib_jf_id
-                    )
-                    
+
                     if items_result.get("ok"):
                         items_data = items_result.get("data", {})
                         if isinstance(items_data, dict):
@@ -276,7 +299,6 @@ class SyncService:
                     break
 
                 # Filter for playback events only
-                from services.mappers import map_playback_events
                 playback_events = [
                     item for item in items
                     if item.get("Type") == "VideoPlaybackStopped"
@@ -307,6 +329,7 @@ class SyncService:
                     break
 
             if events_count > 0:
+                self.repository.analyze()
                 self.repository.refresh_play_stats()
 
             now = int(time.time())
@@ -406,7 +429,6 @@ class SyncService:
                 if not isinstance(page, list) or not page:
                     break
 
-                from services.mappers import map_playback_events
                 mapped = map_playback_events(page, user_lookup=None)
 
                 for m in mapped:
@@ -458,8 +480,6 @@ class SyncService:
         Perform initial server setup sync combining full data sync
         and full activity log pull.
         """
-        import time
-
         start_time = time.time()
         errors: List[str] = []
 
@@ -3,16 +3,27 @@ Pytest integration tests validating route availability, template rendering,
 static file serving, and fundamental page structure provided by Flask.
 """
 
+import re
+from datetime import date, datetime
 from typing import Generator
 
 import pytest
+from flask.json.provider import DefaultJSONProvider
+
 from app import create_app
 
+NAVBAR_HOME_ACTIVE = re.compile(
+    r'<header class="navbar".*?<a href="/" class="active">Home</a>'
+    r'.*?>Users<.*?>Libraries<.*?>Settings<',
+    re.DOTALL,
+)
+
 
-@pytest.fixture()
+@pytest.fixture(scope="module")
 def client() -> Generator:
     """
-    Create Flask test client with DEBUG enabled.
+    Create Flask test client with DEBUG enabled. The tests only issue
+    read-only GETs, so one app instance is shared across the module.
     
     :return: A test client instance for making requests
     :rtype: Generator[Any, None, None]
@@ -53,14 +64,8 @@ def test_index_has_navbar_and_active_home(client) -> None:
     """
     resp = client.get("/")
     body = resp.get_data(as_text=True)
-    # Navbar elements
-    assert '<header class="navbar"' in body
-    assert ">Home<" in body
-    assert ">Users<" in body
-    assert ">Libraries<" in body
-    assert ">Settings<" in body
-    # Active state on Home for index route
-    assert '<a href="/" class="active">Home</a>' in body
+    # Navbar elements in order, with the active state on Home
+    assert NAVBAR_HOME_ACTIVE.search(body)
 
 def test_static_css_is_served(client) -> None:
     """
@@ -81,4 +86,103 @@ def test_static_logo_is_served(client) -> None:
     """
     resp = client.get("/assets/images/borealis.png")
     assert resp.status_code == 200
-    assert resp.headers.get("Content-Type", "").startswith("image/")
\ No newline at end of file
+    assert resp.headers.get("Content-Type", "").startswith("image/")
+
+
+def test_pages_render_from_cache_without_auto_reload(monkeypatch) -> None:
+    """
+    Ensure cached page HTML is reused and keeps per-route active state.
+
+    :param monkeypatch: Pytest monkeypatch fixture
+    :type monkeypatch: MonkeyPatch
+    """
+    import app as app_module
+
+    rendered = []
+    real_render = app_module.render_template
+
+    def counting_render(template, **context):
+        rendered.append(template)
+        return real_render(template, **context)
+
+    monkeypatch.setattr(app_module, "render_template", counting_render)
+
+    app = create_app({"DEBUG": True, "TEMPLATES_AUTO_RELOAD": False})
+    with app.test_client() as client:
+        first = client.get("/").get_data(as_text=True)
+        second = client.get("/").get_data(as_text=True)
+        users = client.get("/users").get_data(as_text=True)
+        mounted = client.get(
+            "/", base_url="http://localhost/borealis"
+        ).get_data(as_text=True)
+
+    assert rendered == ["index.html", "users.html", "index.html"]
+    assert first == second
+    assert 'href="/borealis/static/css/site.css"' in mounted
+    assert '<a href="/" class="active">Home</a>' in first
+    assert '<a href="/users" class="active">Users</a>' in users
+
+
+def test_static_css_revalidates_with_etag(client) -> None:
+    """
+    Ensure a repeat request with a matching ETag gets an empty 304.
+    """
+    first = client.get("/static/css/site.css")
+    etag = first.headers.get("ETag")
+    assert etag
+
+    second = client.get(
+        "/static/css/site.css", headers={"If-None-Match": etag}
+    )
+    assert second.status_code == 304
+    assert second.get_data() == b""
+
+
+def test_static_files_are_cacheable_outside_debug(monkeypatch) -> None:
+    """
+    Ensure static files carry a one-hour max-age when not in debug mode.
+
+    :param monkeypatch: Pytest monkeypatch fixture
+    :type monkeypatch: MonkeyPatch
+    """
+    # Keep the non-debug app from starting background syncs or
+    # registering process-exit cleanup
+    monkeypatch.setattr(
+        "services.sync_scheduler.SyncScheduler.start", lambda self: None
+    )
+    monkeypatch.setattr("atexit.register", lambda func: func)
+
+    app = create_app({
+        "DATABASE_URL": "sqlite:///:memory:",
+        "ENCRYPTION_KEY_PATH": ":memory:",
+        "DATA_DATABASE_URL": "sqlite:///:memory:",
+        "TEMPLATE_CACHE_DIR": None,
+    })
+    with app.test_client() as client:
+        css = client.get("/static/css/site.css")
+        logo = client.get("/assets/images/borealis.png")
+
+    assert "max-age=3600" in css.headers.get("Cache-Control", "")
+    assert "max-age=3600" in logo.headers.get("Cache-Control", "")
+
+
+def test_json_responses_match_default_provider(client) -> None:
+    """
+    Ensure JSON bodies match Flask's stdlib provider for dates and
+    non-string keys.
+
+    :param client: The generated client
+    :type client: Any
+    """
+    app = client.application
+    payloads = [
+        {1: "a", 2: "b"},
+        {"at": datetime(2025, 10, 15, 12, 0), "on": date(2025, 1, 2)},
+    ]
+    with app.app_context():
+        stdlib = DefaultJSONProvider(app)
+        for payload in payloads:
+            assert (
+                app.json.response(payload).get_data()
+                == stdlib.response(payload).get_data()
+            )
@@ -3,6 +3,9 @@ Tests for the Jellyfin client module.
 """
 
 import json
+
+import pytest
+
 from services.jellyfin import create_client
 
 
@@ -15,34 +18,28 @@ class FakeSettings:
         }
 
 
-class FakeResp:
-    def __init__(self, status: int, payload):
-        self.status = status
-        self._payload = payload
-
-    def read(self) -> bytes:
-        return json.dumps(self._payload).encode("utf-8")
+# Canned response bodies, serialized once at import
+SYS_INFO_BYTES = json.dumps({"name": "jellyfin", "version": "10.8"}).encode()
+USERS_BYTES = json.dumps([{"Id": "1", "Name": "admin"}]).encode()
+FOLDERS_BYTES = json.dumps([{"Id": "folder1", "Path": "/media"}]).encode()
+EMPTY_BYTES = b"{}"
 
-    def __enter__(self):
-        return self
 
-    def __exit__(self, exc_type, exc_val, exc_tb):
-        return False
+class FakeResp:
+    def __init__(self, status: int, body: bytes, reason: str = "OK"):
+        self.status_code = status
+        self.reason = reason
+        self.content = body
 
 
-def fake_urlopen(req, timeout: float = 5.0):
-    url = getattr(req, "full_url", None)
-    if not url:
-        url = (
-            req.get_full_url() if hasattr(req, "get_full_url") else ""
-        )
+def fake_get(self, url: str, headers=None, timeout: float = 5.0):
     if url.endswith("/System/Info"):
-        return FakeResp(200, {"name": "jellyfin", "version": "10.8"})
+        return FakeResp(200, SYS_INFO_BYTES)
     if url.endswith("/Users"):
-        return FakeResp(200, [{"Id": "1", "Name": "admin"}])
+        return FakeResp(200, USERS_BYTES)
     if url.endswith("/Library/MediaFolders"):
-        return FakeResp(200, [{"Id": "folder1", "Path": "/media"}])
-    return FakeResp(404, {})
+        return FakeResp(200, FOLDERS_BYTES)
+    return FakeResp(404, EMPTY_BYTES, reason="Not Found")
 
 
 def test_system_users_libraries_success(monkeypatch):
@@ -55,7 +52,7 @@ def test_system_users_libraries_success(monkeypatch):
     svc = FakeSettings()
     client = create_client(svc)
 
-    monkeypatch.setattr("services.jellyfin.urlopen", fake_urlopen)
+    monkeypatch.setattr("requests.Session.get", fake_get)
 
     sys_info = client.system_info()
     assert sys_info["ok"] is True
@@ -82,18 +79,10 @@ def test_get_http_error_returns_proper_response(monkeypatch):
     :param monkeypatch: Pytest monkeypatch fixture
     :type monkeypatch: MonkeyPatch
     """
-    from urllib.error import HTTPError
-
-    def raise_http(req, timeout: float = 5.0):
-        raise HTTPError(
-            url="http://fake",
-            code=401,
-            msg="Unauthorized",
-            hdrs=None,
-            fp=None
-        )
+    def unauthorized(self, url: str, headers=None, timeout: float = 5.0):
+        return FakeResp(401, EMPTY_BYTES, reason="Unauthorized")
 
-    monkeypatch.setattr("services.jellyfin.urlopen", raise_http)
+    monkeypatch.setattr("requests.Session.get", unauthorized)
 
     client = create_client(FakeSettings())
     res = client.system_info()
@@ -110,12 +99,12 @@ def test_get_url_error_returns_proper_response(monkeypatch):
     :param monkeypatch: Pytest monkeypatch fixture
     :type monkeypatch: MonkeyPatch
     """
-    from urllib.error import URLError
+    import requests
 
-    def raise_url(req, timeout: float = 5.0):
-        raise URLError("timed out")
+    def raise_conn(self, url: str, headers=None, timeout: float = 5.0):
+        raise requests.ConnectionError("timed out")
 
-    monkeypatch.setattr("services.jellyfin.urlopen", raise_url)
+    monkeypatch.setattr("requests.Session.get", raise_conn)
 
     client = create_client(FakeSettings())
     res = client.system_info()
@@ -126,15 +115,35 @@ def test_get_url_error_returns_proper_response(monkeypatch):
     assert "timed out" in res.get("message", "")
 
 
-def test_missing_settings_returns_400():
-    """
-    Test that missing settings return a 400 error.
+class StaticSettings:
+    def __init__(self, values):
+        self._values = values
+
+    def get(self):
+        return self._values
+
+
+@pytest.mark.parametrize(
+    "settings",
+    [
+        {},
+        {"jf_host": "127.0.0.1", "jf_port": "8096", "jf_api_key": ""},
+        {
+            "jf_host": "127.0.0.1",
+            "jf_port": "eightythree",
+            "jf_api_key": "token123",
+        },
+    ],
+    ids=["missing", "no-token", "bad-port"],
+)
+def test_invalid_settings_return_400(settings):
     """
-    class MissingSettings:
-        def get(self):
-            return {}
+    Test that missing or invalid host/port/token settings return a 400.
 
-    client = create_client(MissingSettings())
+    :param settings: Raw settings dict returned by the store
+    :type settings: dict
+    """
+    client = create_client(StaticSettings(settings))
     res = client.system_info()
 
     assert res["ok"] is False
@@ -144,45 +153,79 @@ def test_missing_settings_returns_400():
     )
 
 
-def test_missing_token_returns_400():
+def test_settings_are_cached_until_refresh(monkeypatch):
     """
-    Test that missing API token returns a 400 error.
+    Test that settings are read once across calls until refreshed.
     """
-    class NoTokenSettings:
+    class CountingSettings(FakeSettings):
+        calls = 0
+
         def get(self):
-            return {
-                "jf_host": "127.0.0.1",
-                "jf_port": "8096",
-                "jf_api_key": "",
-            }
+            CountingSettings.calls += 1
+            return super().get()
 
-    client = create_client(NoTokenSettings())
-    res = client.system_info()
+    monkeypatch.setattr("requests.Session.get", fake_get)
 
-    assert res["ok"] is False
-    assert res["status"] == 400
-    assert "Missing or invalid host/port/token" in res.get(
-        "message", ""
+    client = create_client(CountingSettings())
+    client.system_info()
+    client.users()
+    assert CountingSettings.calls == 1
+
+    client.refresh()
+    client.libraries()
+    assert CountingSettings.calls == 2
+
+
+def test_probe_uses_explicit_credentials(monkeypatch):
+    """
+    Test that probe checks /System/Info on the given base URL.
+    """
+    seen = []
+
+    def record_get(self, url: str, headers=None, timeout: float = 5.0):
+        seen.append((url, headers, timeout))
+        if "good" in url:
+            return FakeResp(200, EMPTY_BYTES)
+        return FakeResp(401, EMPTY_BYTES, reason="Unauthorized")
+
+    monkeypatch.setattr("requests.Session.get", record_get)
+
+    client = create_client(FakeSettings())
+    ok = client.probe("http://good:8096", "abc")
+    assert ok == {"ok": True, "status": 200}
+    assert seen[0] == (
+        "http://good:8096/System/Info", {"X-Emby-Token": "abc"}, 3.0
     )
 
+    bad = client.probe("http://bad:8096", "abc")
+    assert bad["ok"] is False
+    assert "HTTP error from Jellyfin (401)" in bad["message"]
+
 
-def test_non_numeric_port_returns_400():
+def test_network_errors_report_underlying_reason(monkeypatch):
     """
-    Test that non-numeric port returns a 400 error.
+    Test that connection failures report the socket error rather than
+    urllib3's connection pool wrapper text.
     """
-    class BadPortSettings:
-        def get(self):
-            return {
-                "jf_host": "127.0.0.1",
-                "jf_port": "eightythree",
-                "jf_api_key": "token123",
-            }
+    import socket
 
-    client = create_client(BadPortSettings())
-    res = client.system_info()
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        port = sock.getsockname()[1]
 
-    assert res["ok"] is False
-    assert res["status"] == 400
-    assert "Missing or invalid host/port/token" in res.get(
-        "message", ""
-    )
\ No newline at end of file
+    monkeypatch.setattr("services.jellyfin.time.sleep", lambda _: None)
+    client = create_client(StaticSettings({
+        "jf_host": "127.0.0.1",
+        "jf_port": str(port),
+        "jf_api_key": "token123",
+    }))
+
+    probed = client.probe(f"http://127.0.0.1:{port}", "abc")
+    assert probed["ok"] is False
+    assert probed["message"].startswith("Network error: [Errno")
+    assert "HTTPConnectionPool" not in probed["message"]
+
+    res = client.system_info()
+    assert res["status"] == 0
+    assert "retries: [Errno" in res["message"]
+    assert "HTTPConnectionPool" not in res["message"]
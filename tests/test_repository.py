@@ -41,4 +41,150 @@ def test_last_activity_log_sync_roundtrip() -> None:
     repo.set_last_activity_log_sync(ts)
 
     got = repo.get_last_activity_log_sync()
-    assert got == ts or got is None
\ No newline at end of file
+    assert got == ts or got is None
+
+
+def test_refresh_play_stats_counts_playback_events() -> None:
+    repo = Repository(database_url="sqlite:///:memory:")
+
+    repo.upsert_users([
+        {"jellyfin_id": "u1", "name": "alice"},
+        {"jellyfin_id": "u2", "name": "bob"},
+    ])
+    repo.upsert_libraries([{"jellyfin_id": "lib1", "name": "Movies"}])
+    lib_id = repo.list_libraries()[0]["id"]
+    repo.upsert_items([
+        {"jellyfin_id": "i1", "library_id": lib_id, "name": "One"},
+        {"jellyfin_id": "i2", "library_id": lib_id, "name": "Two"},
+    ])
+
+    now = int(time.time())
+    repo.insert_playback_events([
+        {"activity_log_id": 1, "user_id": "u1", "item_id": "i1",
+         "activity_at": now},
+        {"activity_log_id": 2, "user_id": "u1", "item_id": "i2",
+         "activity_at": now},
+        {"activity_log_id": 3, "user_id": "u1", "item_id": "i1",
+         "activity_at": now},
+    ])
+
+    result = repo.refresh_play_stats()
+    assert result == {
+        "users_updated": 2,
+        "items_updated": 2,
+        "libraries_updated": 1,
+    }
+
+    users = {u["jellyfin_id"]: u for u in repo.list_users()}
+    assert users["u1"]["total_plays"] == 3
+    assert users["u2"]["total_plays"] == 0
+
+    top_items = repo.get_top_items_by_plays(limit=2)
+    assert [i["jellyfin_id"] for i in top_items] == ["i1", "i2"]
+    assert [i["play_count"] for i in top_items] == [2, 1]
+
+    libs = repo.get_library_stats()
+    assert libs[0]["total_plays"] == 3
+
+
+def test_upsert_updates_existing_rows_in_place() -> None:
+    repo = Repository(database_url="sqlite:///:memory:")
+
+    repo.upsert_libraries([{"jellyfin_id": "lib1", "name": "Movies"}])
+    repo.set_library_tracked("lib1", True)
+    repo.archive_missing_libraries(["other"])
+
+    count = repo.upsert_libraries([
+        {"jellyfin_id": "lib1", "name": "Films"},
+        {"name": "no id"},
+    ])
+    assert count == 1
+
+    libs = repo.list_libraries(include_archived=True)
+    assert len(libs) == 1
+    assert libs[0]["name"] == "Films"
+    assert libs[0]["tracked"] is True
+    assert libs[0]["archived"] is False
+
+
+def test_insert_playback_events_skips_already_synced() -> None:
+    repo = Repository(database_url="sqlite:///:memory:")
+
+    events = [
+        {"activity_log_id": 10, "user_id": "u1", "item_id": "i1",
+         "activity_at": 100},
+        {"activity_log_id": 11, "user_id": "u1", "item_id": "i2"},
+        {"activity_log_id": 12, "user_id": "", "item_id": "i3"},
+    ]
+    assert repo.insert_playback_events(events) == 2
+    assert repo.insert_playback_events(events) == 0
+
+
+def test_archive_missing_items_handles_large_active_lists() -> None:
+    repo = Repository(database_url="sqlite:///:memory:")
+
+    repo.upsert_libraries([{"jellyfin_id": "lib1", "name": "Movies"}])
+    lib_id = repo.list_libraries()[0]["id"]
+    items = [
+        {"jellyfin_id": f"i{n}", "library_id": lib_id, "name": f"Item {n}"}
+        for n in range(1500)
+    ]
+    repo.upsert_items(items)
+
+    active = [f"i{n}" for n in range(1500, 3000)] + ["i0"]
+    assert repo.archive_missing_items(lib_id, active) == 1499
+    assert repo.archive_missing_items(lib_id, active) == 0
+
+
+def test_schema_created_once_per_database(tmp_path, monkeypatch) -> None:
+    from services import repository as repository_module
+
+    url = f"sqlite:///{tmp_path / 'data.db'}"
+    calls = []
+    original = repository_module.Base.metadata.create_all
+
+    def counting_create_all(*args, **kwargs):
+        calls.append(args)
+        return original(*args, **kwargs)
+
+    monkeypatch.setattr(
+        repository_module.Base.metadata, "create_all", counting_create_all
+    )
+
+    first = Repository(database_url=url)
+    second = Repository(database_url=url)
+    assert len(calls) == 1
+    assert second.list_users() == []
+    first.engine.dispose()
+    second.engine.dispose()
+
+
+def test_missing_indexes_added_to_existing_database(tmp_path) -> None:
+    from sqlalchemy import text
+
+    url = f"sqlite:///{tmp_path / 'data.db'}"
+    old = Repository(database_url=url)
+    with old.engine.begin() as conn:
+        conn.execute(text("DROP INDEX idx_item_library_jellyfin"))
+    old.engine.dispose()
+    Repository._schema_ready.discard(url)
+
+    repo = Repository(database_url=url)
+    with repo.engine.connect() as conn:
+        names = conn.execute(text(
+            "SELECT name FROM sqlite_master "
+            "WHERE type = 'index' AND tbl_name = 'items'"
+        )).scalars().all()
+    assert "idx_item_library_jellyfin" in names
+    repo.engine.dispose()
+
+
+def test_list_users_supports_limit_and_offset() -> None:
+    repo = Repository(database_url="sqlite:///:memory:")
+    repo.upsert_users([
+        {"jellyfin_id": f"u{n}", "name": f"user {n}"} for n in range(5)
+    ])
+
+    assert len(repo.list_users()) == 5
+    page = repo.list_users(limit=2, offset=1)
+    assert [u["jellyfin_id"] for u in page] == ["u1", "u2"]
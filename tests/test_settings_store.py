@@ -11,10 +11,16 @@ def client() -> Generator:
     """
     db_path = "sqlite:///test_settings.db"
     key_path = "test_secret.key"
-    if os.path.exists("test_settings.db"):
-        os.remove("test_settings.db")
-    if os.path.exists(key_path):
-        os.remove(key_path)
+    # WAL journaling leaves -wal/-shm sidecar files next to the DB
+    files = [
+        "test_settings.db",
+        "test_settings.db-wal",
+        "test_settings.db-shm",
+        key_path,
+    ]
+    for path in files:
+        if os.path.exists(path):
+            os.remove(path)
 
     app = create_app({
         "DEBUG": True,
@@ -25,10 +31,9 @@ def client() -> Generator:
         yield client
 
     # Cleanup
-    if os.path.exists("test_settings.db"):
-        os.remove("test_settings.db")
-    if os.path.exists(key_path):
-        os.remove(key_path)
+    for path in files:
+        if os.path.exists(path):
+            os.remove(path)
 
 
 def test_api_settings_bootstrap_defaults(client) -> None:
@@ -82,4 +87,99 @@ def test_api_settings_clear_key(client) -> None:
     get = client.get("/api/settings")
     assert get.status_code == 200
     data = get.get_json()
-    assert data["jf_api_key"] is None
\ No newline at end of file
+    assert data["jf_api_key"] is None
+
+
+def test_api_settings_get_reflects_update_after_cached_read(client) -> None:
+    """
+    A cached GET body must be refreshed after settings are updated.
+    """
+    before = client.get("/api/settings").get_json()
+    assert before["hour_format"] == "24"
+
+    client.put("/api/settings", json={"hour_format": "12"})
+
+    after = client.get("/api/settings")
+    assert after.mimetype == "application/json"
+    assert after.get_json()["hour_format"] == "12"
+
+
+def test_encryption_key_created_once_with_owner_only_mode(tmp_path) -> None:
+    """
+    The key file is created on first use and reused afterwards.
+    """
+    from services.settings_store import SettingsService
+
+    key_path = tmp_path / "secret.key"
+    first = SettingsService(
+        database_url="sqlite:///:memory:",
+        encryption_key_path=str(key_path),
+    )
+    assert key_path.exists()
+    assert (key_path.stat().st_mode & 0o777) == 0o600
+
+    second = SettingsService(
+        database_url="sqlite:///:memory:",
+        encryption_key_path=str(key_path),
+    )
+    token = first.fernet.encrypt(b"abc")
+    assert second.fernet.decrypt(token) == b"abc"
+
+
+def test_encryption_key_race_loser_uses_existing_key(
+    tmp_path, monkeypatch
+) -> None:
+    """
+    If another process places the key file first, its key is used and
+    no temporary files are left behind.
+    """
+    from cryptography.fernet import Fernet
+    from services.settings_store import SettingsService
+
+    key_path = tmp_path / "secret.key"
+    winner_key = Fernet.generate_key()
+    real_link = os.link
+
+    def link_after_winner(src, dst):
+        with open(dst, "wb") as fh:
+            fh.write(winner_key)
+        real_link(src, dst)
+
+    monkeypatch.setattr(os, "link", link_after_winner)
+
+    svc = SettingsService(
+        database_url="sqlite:///:memory:",
+        encryption_key_path=str(key_path),
+    )
+    token = Fernet(winner_key).encrypt(b"abc")
+    assert svc.fernet.decrypt(token) == b"abc"
+    assert [p.name for p in tmp_path.iterdir()] == ["secret.key"]
+
+
+def test_encryption_key_persisted_without_hard_link_support(
+    tmp_path, monkeypatch
+) -> None:
+    """
+    Filesystems without hard links still get a persisted key file.
+    """
+    from services.settings_store import SettingsService
+
+    def no_link(src, dst):
+        raise PermissionError(1, "Operation not permitted")
+
+    monkeypatch.setattr(os, "link", no_link)
+
+    key_path = tmp_path / "secret.key"
+    first = SettingsService(
+        database_url="sqlite:///:memory:",
+        encryption_key_path=str(key_path),
+    )
+    assert (key_path.stat().st_mode & 0o777) == 0o600
+    assert [p.name for p in tmp_path.iterdir()] == ["secret.key"]
+
+    second = SettingsService(
+        database_url="sqlite:///:memory:",
+        encryption_key_path=str(key_path),
+    )
+    token = first.fernet.encrypt(b"abc")
+    assert second.fernet.decrypt(token) == b"abc"
@@ -1,5 +1,7 @@
+import threading
 import time
 
+from services.data_models import Item
 from services.repository import Repository
 from services.sync_service import SyncService
 
@@ -49,4 +51,47 @@ def test_manual_full_sync_does_not_auto_track() -> None:
 
     libs = {l["jellyfin_id"]: l for l in repo.list_libraries()}
     assert libs["lib_movies"]["tracked"] is False
-    assert libs["lib_tv"]["tracked"] is False
\ No newline at end of file
+    assert libs["lib_tv"]["tracked"] is False
+
+
+def test_full_sync_fetches_items_for_every_tracked_library() -> None:
+    # Both tracked libraries must be in flight at once to pass the
+    # barrier; a serial loop would time out waiting for the second.
+    barrier = threading.Barrier(2, timeout=5)
+    fetch_threads = {}
+
+    class ItemsJellyfinClient(FakeJellyfinClient):
+        def library_items(self, library_id: str):
+            fetch_threads[library_id] = threading.get_ident()
+            barrier.wait()
+            if library_id == "lib_movies":
+                # Finish the first library last to check result order
+                time.sleep(0.05)
+            return {
+                "ok": True,
+                "data": {
+                    "Items": [
+                        {"Id": f"{library_id}_item", "Name": library_id}
+                    ]
+                },
+            }
+
+    repo = Repository(database_url="sqlite:///:memory:")
+    sync = SyncService(jellyfin_client=ItemsJellyfinClient(), repository=repo)
+
+    res = sync.sync_full(auto_track=True)
+    assert res.success is True
+    assert res.items_synced == 2
+    assert set(fetch_threads) == {"lib_movies", "lib_tv"}
+    assert len(set(fetch_threads.values())) == 2
+
+    libs = {l["id"]: l["jellyfin_id"] for l in repo.list_libraries()}
+    with repo.SessionLocal() as session:
+        items = {
+            item.jellyfin_id: libs[item.library_id]
+            for item in session.query(Item)
+        }
+    assert items == {
+        "lib_movies_item": "lib_movies",
+        "lib_tv_item": "lib_tv",
+    }